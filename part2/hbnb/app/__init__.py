@@ -6,14 +6,54 @@ and configure Flask-RESTx.
 """
 
 
-from flask import Flask
+import os
+
+import orjson
+from flask import Flask, make_response
+from flask.json.provider import JSONProvider
 from flask_restx import Api
+from werkzeug.middleware.profiler import ProfilerMiddleware
 from app.api.v1.users import api as users_ns
 from app.api.v1.places import api as places_ns
 from app.api.v1.amenities import api as amenities_ns
 from app.api.v1.reviews import api as reviews_ns
 
 
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Used by jsonify() and request.get_json() so the whole application
+    shares the same encoder as the API representation below.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes document."""
+        return orjson.loads(s)
+
+
+def output_json(data, code, headers=None):
+    """
+    Flask-RESTx representation for 'application/json' using orjson.
+
+    Args:
+        data: The (already serializable) response body.
+        code (int): HTTP status code.
+        headers (dict | None): Extra response headers.
+
+    Returns:
+        Response: The Flask response object.
+    """
+    resp = make_response(orjson.dumps(data), code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = 'application/json'
+    return resp
+
+
 def create_app():
     """
     Application factory function.
@@ -26,16 +66,26 @@ def create_app():
         Flask: The configured Flask application instance.
         """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     api = Api(
         app, version='1.0',
         title='HBnB API',
         description='HBnB Application API',
         doc='/api/v1/'
         )
+    api.representations['application/json'] = output_json
 
     # Register the users namespace
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(places_ns, path='/api/v1/places')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
+
+    # Opt-in per-request cProfile dumps (view them with SnakeViz or Tuna)
+    if os.environ.get('HBNB_PROFILE'):
+        profile_dir = os.path.abspath('profiler_results')
+        os.makedirs(profile_dir, exist_ok=True)
+        app.wsgi_app = ProfilerMiddleware(
+            app.wsgi_app, profile_dir=profile_dir, restrictions=[30]
+            )
     return app
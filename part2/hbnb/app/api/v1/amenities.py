@@ -1,7 +1,10 @@
 #!/usr/bin/python3
 
+import fastjsonschema
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.cache import cached_collection
+from app.api.v1.validation import schema_error
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -10,6 +13,14 @@ amenity_model = api.model('Amenity', {
     'name': fields.String(required=True, description='Name of the amenity')
 })
 
+# Compiled once at import, replaces Flask-RESTx's per-request validation
+validate_amenity = fastjsonschema.compile(amenity_model.__schema__)
+
+
+def _dump_amenity(amenity):
+    """Serialize an Amenity into its public response shape."""
+    return {'id': amenity.id, 'name': amenity.name}
+
 
 @api.route('/')
 class AmenityList(Resource):
@@ -25,13 +36,15 @@ class AmenityList(Resource):
         except (TypeError, ValueError) as e:
             return {"error": str(e)}, 400
 
-        return {'id': new_amenity.id, 'name': new_amenity.name}, 201
+        return _dump_amenity(new_amenity), 201
 
     @api.response(200, 'List of amenities retrieved successfully')
     def get(self):
         """Retrieve a list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [{'id': obj.id, 'name': obj.name} for obj in amenities], 200
+        return cached_collection(
+            'amenities', facade.amenity_repo,
+            lambda: list(map(_dump_amenity, facade.get_all_amenities()))
+            )
 
 
 @api.route('/<amenity_id>')
@@ -44,15 +57,20 @@ class AmenityResource(Resource):
         if not amen_id:
             return {'error': 'Amenity not found'}, 404
 
-        return {'id': amen_id.id, 'name': amen_id.name}, 200
+        return _dump_amenity(amen_id), 200
 
-    @api.expect(amenity_model, validate=True)
+    @api.expect(amenity_model)
     @api.response(200, 'Amenity updated successfully')
     @api.response(404, 'Amenity not found')
     @api.response(400, 'Invalid input data')
     def put(self, amenity_id):
         """Update an amenity's information"""
         payload = api.payload
+        try:
+            validate_amenity(payload)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return {'error': schema_error(e)}, 400
+
         try:
             amen_update = facade.update_amenity(amenity_id, payload)
         except (TypeError, ValueError) as e:
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+Response cache module.
+
+Keeps the serialized body of collection endpoints in memory so that
+repeated GET requests skip re-serialization, and answers conditional
+requests (If-None-Match) with 304 Not Modified.
+
+Entries are invalidated as soon as the backing repository is written
+to, and in any case expire after CACHE_TTL seconds.
+"""
+
+
+import hashlib
+import time
+
+import orjson
+from flask import Response, request
+
+
+CACHE_TTL = 5  # seconds
+
+_cache = {}
+
+
+def cached_collection(key, repo, build):
+    """
+    Build (or reuse) the JSON response of a collection endpoint.
+
+    Args:
+        key (str): Cache slot name, one per namespace.
+        repo (InMemoryRepository): Repository backing the collection.
+            Its version number invalidates the entry on writes.
+        build (callable): Returns the serializable payload on a miss.
+
+    Returns:
+        Response: 200 with the JSON body and its ETag, or 304 if the
+        client already holds the current representation.
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is None or entry[0] != repo.version or entry[1] <= now:
+        body = orjson.dumps(build())
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = (repo.version, now + CACHE_TTL, etag, body)
+        _cache[key] = entry
+
+    etag, body = entry[2], entry[3]
+
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    return response
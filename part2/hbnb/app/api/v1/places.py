@@ -19,6 +19,10 @@ by the facade (HBnBFacade).
 
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.streaming import stream_collection
+from app.api.v1.users import _dump_user
+from app.api.v1.amenities import _dump_amenity
+from app.api.v1.reviews import _dump_review
 
 
 api = Namespace('places', description='Place operations')
@@ -126,6 +130,42 @@ place_update_model = api.model('PlaceUpdate', {
 })
 
 
+# ------------------------------------------------------------
+# ---------------------- SERIALIZERS -------------------------
+# ------------------------------------------------------------
+def _dump_place(place):
+    """Serialize a Place with its scalar fields and owner_id."""
+    return {
+        'id': place.id,
+        'title': place.title,
+        'description': place.description,
+        'price': place.price,
+        'latitude': place.latitude,
+        'longitude': place.longitude,
+        'owner_id': place.owner_id
+    }
+
+
+def _dump_place_light(place):
+    """Serialize the light Place shape used by the list endpoint."""
+    return {
+        'id': place.id,
+        'title': place.title,
+        'latitude': place.latitude,
+        'longitude': place.longitude
+    }
+
+
+def _dump_place_review(review):
+    """Serialize a review nested in a place's details."""
+    return {
+        'id': review.id,
+        'text': review.text,
+        'rating': review.rating,
+        'user_id': review.user_id
+    }
+
+
 # ------------------------------------------------------------
 # ------------------------ RESOURCES -------------------------
 # ------------------------------------------------------------
@@ -151,20 +191,17 @@ class PlaceList(Resource):
             tuple: (response_body, status_code)
         """
         payload = api.payload
+        owner_id = payload['owner_id']
 
         # Ensure owner exists (consistent with create_review checks)
-        owner = facade.get_user(payload['owner_id'])
-        if not owner:
+        if not facade.user_exists(owner_id):
             return {'error': 'Owner not found'}, 400
 
-        amenities = payload.get('amenities', [])
-        if amenities is None:
-            amenities = []
-        if not isinstance(amenities, list):
-            return {'error': 'amenities must be a list of amenity IDs'}, 400
+        # The validated payload guarantees a list of strings when present
+        amenities = payload.get('amenities') or []
 
         place_data = {
-            'owner_id': payload['owner_id'],
+            'owner_id': owner_id,
             'title': payload['title'],
             'description': payload.get('description', ''),
             'price': payload['price'],
@@ -178,15 +215,7 @@ class PlaceList(Resource):
         except (TypeError, ValueError) as e:
             return {'error': str(e)}, 400
 
-        return {
-            'id': new_place.id,
-            'title': new_place.title,
-            'description': new_place.description,
-            'price': new_place.price,
-            'latitude': new_place.latitude,
-            'longitude': new_place.longitude,
-            'owner_id': new_place.owner_id
-        }, 201
+        return _dump_place(new_place), 201
 
     @api.response(200, 'List of places retrieved successfully')
     def get(self):
@@ -198,18 +227,10 @@ class PlaceList(Resource):
             (id, title, latitude, longitude), as shown in the project examples.
 
         Returns:
-            tuple: (list_of_places, status_code)
+            Response: streamed JSON list of places
         """
-        places = facade.get_all_places()
-        return [
-            {
-                'id': p.id,
-                'title': p.title,
-                'latitude': p.latitude,
-                'longitude': p.longitude
-            }
-            for p in places
-        ], 200
+        # Streamed rather than cached (no ETag), see app.api.v1.streaming
+        return stream_collection(facade.get_all_places(), _dump_place_light)
 
 
 @api.route('/<place_id>')
@@ -226,19 +247,17 @@ class PlaceResource(Resource):
 
         Includes:
         - owner details (nested)
-        - amenities (currently returned as IDs only if
-          amenity resolution is not available)
+        - amenities (nested, unknown IDs are skipped)
         - reviews for this place (nested)
 
         Returns:
             tuple: (place_details, status_code)
         """
-        place = facade.get_place(place_id)
-        if not place:
+        detail = facade.get_place_detail(place_id)
+        if not detail:
             return {'error': 'Place not found'}, 404
 
-        owner = facade.get_user(place.owner_id)
-        reviews = facade.get_reviews_by_place(place.id)
+        place, owner, amenities, reviews = detail
 
         return {
             'id': place.id,
@@ -247,27 +266,9 @@ class PlaceResource(Resource):
             'price': place.price,
             'latitude': place.latitude,
             'longitude': place.longitude,
-            'owner': {
-                'id': owner.id,
-                'first_name': owner.first_name,
-                'last_name': owner.last_name,
-                'email': owner.email
-            } if owner else None,
-            'amenities': [
-                {'id': amenity.id, 'name': amenity.name}
-                for aid in place.amenity_ids
-                for amenity in [facade.get_amenity(aid)]
-                if amenity is not None
-            ],
-            'reviews': [
-                {
-                    'id': r.id,
-                    'text': r.text,
-                    'rating': r.rating,
-                    'user_id': r.user_id
-                }
-                for r in reviews
-            ]
+            'owner': _dump_user(owner) if owner else None,
+            'amenities': list(map(_dump_amenity, amenities)),
+            'reviews': list(map(_dump_place_review, reviews))
         }, 200
 
     @api.expect(place_update_model, validate=True)
@@ -287,12 +288,6 @@ class PlaceResource(Resource):
         """
         payload = api.payload
 
-        if 'amenities' in payload and payload['amenities'] is not None:
-            if not isinstance(payload['amenities'], list):
-                return {
-                    'error': 'amenities must be a list of amenity IDs'
-                    }, 400
-
         try:
             updated = facade.update_place(place_id, payload)
         except (TypeError, ValueError) as e:
@@ -324,13 +319,4 @@ class PlaceReviewList(Resource):
             return {'error': 'Place not found'}, 404
 
         reviews = facade.get_reviews_by_place(place_id)
-        return [
-            {
-                'id': r.id,
-                'text': r.text,
-                'rating': r.rating,
-                'user_id': r.user_id,
-                'place_id': r.place_id
-            }
-            for r in reviews
-        ], 200
+        return list(map(_dump_review, reviews)), 200
@@ -1,5 +1,8 @@
+import fastjsonschema
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.cache import cached_collection
+from app.api.v1.validation import schema_error
 
 api = Namespace('reviews', description='Review operations')
 
@@ -14,43 +17,48 @@ review_model = api.model('Review', {
     'place_id': fields.String(required=True, description='ID of the place')
 })
 
+# Compiled once at import, replaces Flask-RESTx's per-request validation
+validate_review = fastjsonschema.compile(review_model.__schema__)
+
+
+def _dump_review(review):
+    """Serialize a Review into its public response shape."""
+    return {
+        'id': review.id,
+        'text': review.text,
+        'rating': review.rating,
+        'user_id': review.user_id,
+        'place_id': review.place_id
+    }
+
 
 @api.route('/')
 class ReviewList(Resource):
-    @api.expect(review_model, validate=True)
+    @api.expect(review_model)
     @api.response(201, 'Review successfully created')
     @api.response(400, 'Invalid input data')
     def post(self):
         """Register a new review"""
         review_data = api.payload
+        try:
+            validate_review(review_data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return {'error': schema_error(e)}, 400
 
         try:
             new_review = facade.create_review(review_data)
         except (TypeError, ValueError) as e:
             return {'error': str(e)}, 400
 
-        return {
-            'id': new_review.id,
-            'text': new_review.text,
-            'rating': new_review.rating,
-            'user_id': new_review.user_id,
-            'place_id': new_review.place_id
-        }, 201
+        return _dump_review(new_review), 201
 
     @api.response(200, 'List of reviews retrieved successfully')
     def get(self):
         """Retrieve a list of all reviews"""
-        reviews = facade.get_all_reviews()
-        return [
-            {
-                'id': r.id,
-                'text': r.text,
-                'rating': r.rating,
-                'user_id': r.user_id,
-                'place_id': r.place_id
-            }
-            for r in reviews
-        ], 200
+        return cached_collection(
+            'reviews', facade.review_repo,
+            lambda: list(map(_dump_review, facade.get_all_reviews()))
+            )
 
 
 @api.route('/<review_id>')
@@ -63,21 +71,19 @@ class ReviewResource(Resource):
         if not review:
             return {'error': 'Review not found'}, 404
 
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user_id,
-            'place_id': review.place_id
-        }, 200
+        return _dump_review(review), 200
 
-    @api.expect(review_model, validate=True)
+    @api.expect(review_model)
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
     def put(self, review_id):
         """Update a review's information"""
         review_data = api.payload
+        try:
+            validate_review(review_data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return {'error': schema_error(e)}, 400
 
         try:
             updated = facade.update_review(review_id, review_data)
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+Streaming response module.
+
+Serializes collection endpoints in batches so that large listings never
+hold every response dict (nor the whole JSON document) in memory at once.
+
+The user and place listings are streamed because they are the
+collections expected to grow large. Unlike cached_collection, a streamed
+response has no ETag and no Content-Length: conditional GETs are traded
+for bounded memory. The smaller amenity and review listings keep
+cached_collection.
+"""
+
+
+from itertools import islice
+
+import orjson
+from flask import Response, stream_with_context
+
+
+# Entities serialized per chunk: large enough that a big listing is sent
+# in a few hundred socket writes rather than one per entity.
+STREAM_BATCH_SIZE = 500
+
+
+def stream_collection(items, dump):
+    """
+    Build a streamed JSON array response.
+
+    Args:
+        items (Iterable): Entities to serialize.
+        dump (callable): Turns one entity into a JSON-serializable dict.
+
+    Returns:
+        Response: A 200 response whose body is generated lazily.
+    """
+    def generate():
+        iterator = iter(items)
+        separator = b'['
+        while batch := list(islice(iterator, STREAM_BATCH_SIZE)):
+            # Strip the brackets orjson puts around each batch
+            yield separator + orjson.dumps(list(map(dump, batch)))[1:-1]
+            separator = b','
+        yield b'[]' if separator == b'[' else b']'
+
+    return Response(
+        stream_with_context(generate()),
+        status=200, mimetype='application/json'
+    )
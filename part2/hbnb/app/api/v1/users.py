@@ -1,5 +1,6 @@
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.streaming import stream_collection
 
 api = Namespace('users', description='User operations')
 
@@ -30,6 +31,16 @@ user_update_model = api.model('UserUpdate', {
 })
 
 
+def _dump_user(user):
+    """Serialize a User into its public response shape."""
+    return {
+        'id': user.id,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'email': user.email
+    }
+
+
 @api.route('/')
 class UserList(Resource):
     @api.expect(user_model, validate=True)
@@ -48,26 +59,13 @@ class UserList(Resource):
         except (TypeError, ValueError) as e:
             return {'error': str(e)}, 400
 
-        return {
-            'id': new_user.id,
-            'first_name': new_user.first_name,
-            'last_name': new_user.last_name,
-            'email': new_user.email
-        }, 201
+        return _dump_user(new_user), 201
 
     @api.response(200, 'List of users retrieved successfully')
     def get(self):
         """Retrieve a list of users"""
-        users = facade.get_users()
-        return [
-            {
-                'id': u.id,
-                'first_name': u.first_name,
-                'last_name': u.last_name,
-                'email': u.email
-            }
-            for u in users
-        ], 200
+        # Streamed rather than cached (no ETag), see app.api.v1.streaming
+        return stream_collection(facade.get_users(), _dump_user)
 
 
 @api.route('/<user_id>')
@@ -80,12 +78,7 @@ class UserResource(Resource):
         if not user:
             return {'error': 'User not found'}, 404
 
-        return {
-            'id': user.id,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'email': user.email
-        }, 200
+        return _dump_user(user), 200
 
     @api.expect(user_update_model, validate=True)
     @api.response(200, 'User successfully updated')
@@ -108,9 +101,4 @@ class UserResource(Resource):
         if not updated:
             return {'error': 'User not found'}, 404
 
-        return {
-            'id': updated.id,
-            'first_name': updated.first_name,
-            'last_name': updated.last_name,
-            'email': updated.email
-        }, 200
+        return _dump_user(updated), 200
@@ -0,0 +1,27 @@
+#!/usr/bin/python3
+"""
+Payload validation module.
+
+Helpers shared by the namespaces that validate request payloads with
+schemas compiled by fastjsonschema.
+"""
+
+
+def schema_error(exc):
+    """
+    Turn a fastjsonschema rejection into a client-facing message.
+
+    fastjsonschema names the validated value "data" ("data.rating must
+    be integer"). The offending field is named instead, or "payload"
+    when the whole body is rejected ("payload must be object").
+
+    Args:
+        exc (fastjsonschema.JsonSchemaValueException): The rejection.
+
+    Returns:
+        str: The error message.
+    """
+    if not exc.message.startswith(exc.name):
+        return exc.message
+    field = '.'.join(map(str, exc.path[1:])) or 'payload'
+    return field + exc.message[len(exc.name):]
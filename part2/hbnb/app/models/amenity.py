@@ -19,6 +19,8 @@ class Amenity(BaseModel):
         - Can be associated with multiple places
     """
 
+    __slots__ = ('name',)
+
     def __init__(self, name):
         """
         Initialize a new Amenity instance.
@@ -26,6 +28,30 @@ class Amenity(BaseModel):
         Args:
             name (str): The name of the amenity (required, max 50 chars).
 
+        Raises:
+            TypeError: If name is not a string.
+            ValueError: If name is empty or exceeds 50 characters.
+        """
+        name = self.validate_name(name)
+
+        super().__init__()
+
+        self.name = name
+
+    @staticmethod
+    def validate_name(name):
+        """
+        Validate and normalize an amenity name.
+
+        Shared by the constructor and HBnBFacade.update_amenity so both
+        paths apply the same rules.
+
+        Args:
+            name (str): The raw amenity name.
+
+        Returns:
+            str: The name stripped of surrounding whitespace.
+
         Raises:
             TypeError: If name is not a string.
             ValueError: If name is empty or exceeds 50 characters.
@@ -41,6 +67,4 @@ class Amenity(BaseModel):
         if len(name) > 50:
             raise ValueError("Name must be 50 characters maximum")
 
-        super().__init__()
-
-        self.name = name
+        return name
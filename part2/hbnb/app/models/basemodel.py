@@ -8,10 +8,39 @@ attributes and behavior shared by all business entities
 """
 
 
-import uuid
+import os
+import re
 from datetime import datetime
 
 
+_UUID_RE = re.compile(
+    r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+)
+_UUID_BATCH = 256  # identifiers generated per os.urandom() call
+_uuid_pool = []
+
+
+def _refill_uuid_pool():
+    """
+    Generate a batch of random (version 4) UUID strings.
+
+    Entropy for the whole batch is read with a single os.urandom() call,
+    then sliced and formatted in the canonical dashed form.
+    """
+    raw = os.urandom(16 * _UUID_BATCH).hex()
+    for i in range(0, len(raw), 32):
+        h = raw[i:i + 32]
+        variant = '89ab'[int(h[16], 16) & 0x3]
+        _uuid_pool.append(
+            f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+        )
+
+
+# A forked worker must never hand out ids already pooled by its parent
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
 class BaseModel:
     """
     Base class for all HBnB entities.
@@ -23,6 +52,8 @@ class BaseModel:
         - Generic update mechanism
     """
 
+    __slots__ = ('id', 'created_at', 'updated_at')
+
     def __init__(self):
         """
         Initialize a new BaseModel instance.
@@ -32,9 +63,22 @@ class BaseModel:
             - created_at timestamp
             - updated_at timestamp
         """
-        self.id = str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.id = self._new_id()
+        self.created_at = self.updated_at = datetime.now()
+
+    @classmethod
+    def _new_id(cls):
+        """
+        Return a fresh UUID4 string for a new entity.
+
+        Identifiers are served from a pre-generated pool; tests may
+        monkey-patch this method to get deterministic ids.
+        """
+        try:
+            return _uuid_pool.pop()
+        except IndexError:
+            _refill_uuid_pool()
+            return _uuid_pool.pop()
 
     def save(self):
         """
@@ -73,7 +117,11 @@ class BaseModel:
     @staticmethod
     def _validate_uuid(value, field_name):
         """
-         Validate that a given string is a valid UUID.
+        Validate that a given string is a valid UUID.
+
+        Only the canonical dashed form (8-4-4-4-12 hex digits) is
+        accepted; strings of any other length are rejected before the
+        precompiled regex is tried.
 
         Args:
             value (str): The value to validate.
@@ -86,9 +134,5 @@ class BaseModel:
         if not isinstance(value, str):
             raise TypeError(f"{field_name} must be a string")
 
-        try:
-            uuid.UUID(value)
-        except ValueError as exc:
-            raise ValueError(
-                f"{field_name} must be a valid UUID"
-            ) from exc
+        if len(value) != 36 or _UUID_RE.match(value) is None:
+            raise ValueError(f"{field_name} must be a valid UUID")
@@ -7,8 +7,8 @@ in the HBnB application.
 
 The Place model stores relationships using identifiers:
 - owner_id (str UUID)
-- amenity_ids (list[str UUID])
-- review_ids (list[str UUID])
+- amenity_ids (dict[str UUID, None], used as an insertion-ordered set)
+- review_ids (dict[str UUID, None], used as an insertion-ordered set)
 """
 
 
@@ -26,6 +26,11 @@ class Place(BaseModel):
         - Has a title, optional description, price, and location (lat/long)
     """
 
+    __slots__ = (
+        'owner_id', 'title', 'description', 'price',
+        'latitude', 'longitude', 'review_ids', 'amenity_ids'
+    )
+
     def __init__(
         self, *, owner_id, title, description="", price=0,
         latitude=0, longitude=0, amenities=None
@@ -121,8 +126,8 @@ class Place(BaseModel):
         self.latitude = float(latitude)
         self.longitude = float(longitude)
 
-        self.review_ids = []
-        self.amenity_ids = list(amenities)
+        self.review_ids = {}
+        self.amenity_ids = dict.fromkeys(amenities)
 
     # ------------------------------------------------------------
     # -------------------- RELATIONSHIP HELPERS -------------------
@@ -141,8 +146,7 @@ class Place(BaseModel):
         if not isinstance(review_id, str):
             raise TypeError("review_id must be a string")
         self._validate_uuid(review_id, "review_id")
-        if review_id not in self.review_ids:
-            self.review_ids.append(review_id)
+        self.review_ids.setdefault(review_id)
 
     def remove_review_id(self, review_id):
         """
@@ -158,8 +162,7 @@ class Place(BaseModel):
         if not isinstance(review_id, str):
             raise TypeError("review_id must be a string")
         self._validate_uuid(review_id, "review_id")
-        if review_id in self.review_ids:
-            self.review_ids.remove(review_id)
+        self.review_ids.pop(review_id, None)
 
     def add_amenity_id(self, amenity_id):
         """
@@ -175,8 +178,7 @@ class Place(BaseModel):
         if not isinstance(amenity_id, str):
             raise TypeError("amenity_id must be a string")
         self._validate_uuid(amenity_id, "amenity_id")
-        if amenity_id not in self.amenity_ids:
-            self.amenity_ids.append(amenity_id)
+        self.amenity_ids.setdefault(amenity_id)
 
     def remove_amenity_id(self, amenity_id):
         """
@@ -192,8 +194,28 @@ class Place(BaseModel):
         if not isinstance(amenity_id, str):
             raise TypeError("amenity_id must be a string")
         self._validate_uuid(amenity_id, "amenity_id")
-        if amenity_id in self.amenity_ids:
-            self.amenity_ids.remove(amenity_id)
+        self.amenity_ids.pop(amenity_id, None)
+
+    def set_amenity_ids(self, amenity_ids):
+        """
+        Replace every associated amenity identifier at once.
+
+        All ids are validated before anything is changed, so an invalid
+        id leaves the current amenities untouched. Duplicates are
+        dropped, keeping the first occurrence.
+
+        Args:
+            amenity_ids (list[str]): UUID strings of amenities.
+
+        Raises:
+            TypeError: If amenity_ids is not a list or an id is not a string.
+            ValueError: If an id is not a valid UUID.
+        """
+        if not isinstance(amenity_ids, list):
+            raise TypeError("amenities must be a list of UUID strings")
+        for aid in amenity_ids:
+            self._validate_uuid(aid, "amenity_id")
+        self.amenity_ids = dict.fromkeys(amenity_ids)
 
     # ------------------------------------------------------------
     # ----------- OPTIONAL OBJECT-BASED COMPATIBILITY -------------
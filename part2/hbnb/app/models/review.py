@@ -5,6 +5,8 @@ Review model module.
 This module defines the Review class, which represents a review
 left by a user for a place in the HBnB application.
 """
+import sys
+
 from .basemodel import BaseModel
 
 
@@ -19,6 +21,8 @@ class Review(BaseModel):
         - Refers to one place (place_id)
     """
 
+    __slots__ = ('user_id', 'place_id', 'rating', 'text')
+
     def __init__(self, *, rating, text, user_id, place_id):
         """
         Initialize a new Review instance.
@@ -52,7 +56,9 @@ class Review(BaseModel):
 
         super().__init__()
 
-        self.user_id = user_id
-        self.place_id = place_id
+        # Ids are interned: every review of a place or by a user then
+        # shares one string. They are immutable, so update never re-interns.
+        self.user_id = sys.intern(user_id)
+        self.place_id = sys.intern(place_id)
         self.rating = rating
         self.text = cleaned_text
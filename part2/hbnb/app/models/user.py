@@ -8,9 +8,15 @@ of the HBnB application.
 
 
 import re
+from functools import lru_cache
 from .basemodel import BaseModel
 
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DIGIT_RE = re.compile(r'\d')
+_UPPER_RE = re.compile(r'[A-Z]')
+
+
 class User(BaseModel):
     """
     Represents a user of the HBnB platform.
@@ -21,6 +27,11 @@ class User(BaseModel):
         - Have administrative privileges
     """
 
+    __slots__ = (
+        'first_name', 'last_name', 'email', 'password',
+        'is_admin', 'place_ids', 'review_ids'
+    )
+
     def __init__(
         self, first_name="", last_name="",
         email="", password=""
@@ -34,9 +45,9 @@ class User(BaseModel):
             email (str): The user's email address.
             password (str): The user's password.
         """
-        if not all(
-            isinstance(data, str)
-            for data in (first_name, last_name, email, password)
+        if not (
+            isinstance(first_name, str) and isinstance(last_name, str) and
+            isinstance(email, str) and isinstance(password, str)
         ):
             raise TypeError("Invalid data: all fields must be strings")
 
@@ -67,14 +78,18 @@ class User(BaseModel):
     # self.password = self._validate_password(password)
         self.password = password
         self.is_admin = False
-        self.place_ids = []
-        self.review_ids = []
+        self.place_ids = {}
+        self.review_ids = {}
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _validate_email(email):
         """
         Validate email rules.
 
+        Results are memoized: the same raw email string is only
+        normalized and matched once.
+
         Args:
             email (str): Email to validate.
 
@@ -82,8 +97,7 @@ class User(BaseModel):
             ValueError: If the email does not meet structural requirements.
         """
         email = email.strip().lower()
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not _EMAIL_RE.match(email):
             raise ValueError("Email must be valid")
         return email
 
@@ -103,10 +117,10 @@ class User(BaseModel):
                 "Password is too short: it must contain at least 6 characters"
             )
 
-        if not any(char.isdigit() for char in password):
+        if not _DIGIT_RE.search(password):
             raise ValueError("Password must contain at least one digit")
 
-        if not any(char.isupper() for char in password):
+        if not _UPPER_RE.search(password):
             raise ValueError(
                 "Password must contain at least one uppercase letter"
             )
@@ -120,14 +134,13 @@ class User(BaseModel):
         Args:
             place (Place): The place object to associate.
 
-        Adds the place ID to the user's place_ids list
+        Adds the place ID to the user's place_ids set
         if it is not already present.
         """
         if not hasattr(place, "id"):
             raise TypeError("Place must have an 'id' attribute")
         self._validate_uuid(place.id, "place.id")
-        if place.id not in self.place_ids:
-            self.place_ids.append(place.id)
+        self.place_ids.setdefault(place.id)
 
     def remove_place(self, place):
         """
@@ -136,14 +149,13 @@ class User(BaseModel):
         Args:
             place (Place): The place object to remove.
 
-        Removes the place ID from the user's place_ids list
+        Removes the place ID from the user's place_ids set
         if it exists.
         """
         if not hasattr(place, "id"):
             raise TypeError("Place must have an 'id' attribute")
         self._validate_uuid(place.id, "place.id")
-        if place.id in self.place_ids:
-            self.place_ids.remove(place.id)
+        self.place_ids.pop(place.id, None)
 
     def add_review(self, review):
         """
@@ -152,14 +164,13 @@ class User(BaseModel):
         Args:
             review (Review): The review object to associate.
 
-        Adds the review ID to the user's review_ids list
+        Adds the review ID to the user's review_ids set
         if it is not already present.
         """
         if not hasattr(review, "id"):
             raise TypeError("Review must have an 'id' attribute")
         self._validate_uuid(review.id, "review.id")
-        if review.id not in self.review_ids:
-            self.review_ids.append(review.id)
+        self.review_ids.setdefault(review.id)
 
     def remove_review(self, review):
         """
@@ -168,11 +179,10 @@ class User(BaseModel):
         Args:
             review (Review): The review object to remove.
 
-        Removes the review ID from the user's review_ids list
+        Removes the review ID from the user's review_ids set
         if it exists.
         """
         if not hasattr(review, "id"):
             raise TypeError("Review must have an 'id' attribute")
         self._validate_uuid(review.id, "review.id")
-        if review.id in self.review_ids:
-            self.review_ids.remove(review.id)
+        self.review_ids.pop(review.id, None)
@@ -8,6 +8,7 @@ implementation used for temporary object storage.
 
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 
 
 class Repository(ABC):
@@ -40,6 +41,19 @@ class Repository(ABC):
         """
         pass
 
+    @abstractmethod
+    def exists(self, obj_id):
+        """
+        Check whether an object with the given identifier is stored.
+
+        Args:
+            obj_id (str): The unique identifier of the object.
+
+        Returns:
+            bool: True if the object exists, otherwise False.
+        """
+        pass
+
     @abstractmethod
     def get_all(self):
         """
@@ -58,6 +72,9 @@ class Repository(ABC):
         Args:
             obj_id (str): The unique identifier of the object.
             data (dict): A dictionary of attributes to update.
+
+        Returns:
+            The updated object if found, otherwise None.
         """
         pass
 
@@ -94,9 +111,50 @@ class InMemoryRepository(Repository):
     This implementation is temporary and intended for development
     before integrating a database-backed persistence layer.
     """
-    def __init__(self):
-        """Initialize the in-memory storage."""
+    def __init__(self, indexes=()):
+        """
+        Initialize the in-memory storage.
+
+        The version counter is incremented on every write so that
+        callers can cheaply detect whether the stored data changed.
+
+        Secondary indexes ({attr_name: {attr_value: {obj_id: None}}})
+        are built lazily by get_by_attribute and kept in sync on writes.
+
+        Args:
+            indexes (Iterable[str]): Attribute names to index from the
+                start, so that their first lookup needs no scan.
+        """
         self._storage = {}
+        self._indexes = {attr_name: {} for attr_name in indexes}
+        self._snapshot = (None, ())
+        self.version = 0
+
+    def _index_add(self, obj):
+        """
+        Register an object in every secondary index.
+
+        Objects missing the attribute, or holding an unhashable value,
+        are left out of that index rather than failing the write.
+        """
+        for attr_name, index in self._indexes.items():
+            try:
+                index.setdefault(getattr(obj, attr_name), {})[obj.id] = None
+            except (AttributeError, TypeError):
+                continue
+
+    def _index_remove(self, obj):
+        """Unregister an object from every secondary index."""
+        for attr_name, index in self._indexes.items():
+            try:
+                value = getattr(obj, attr_name)
+                bucket = index.get(value)
+            except (AttributeError, TypeError):
+                continue
+            if bucket is not None:
+                bucket.pop(obj.id, None)
+                if not bucket:
+                    del index[value]
 
     def add(self, obj):
         """
@@ -105,7 +163,31 @@ class InMemoryRepository(Repository):
         Args:
             obj: The object instance to store. Must have an 'id' attribute.
         """
+        previous = self._storage.get(obj.id)
+        if previous is not None:
+            self._index_remove(previous)
+        self._index_add(obj)
         self._storage[obj.id] = obj
+        self.version += 1
+
+    def bulk_add(self, objs):
+        """
+        Store many objects at once (e.g. when loading seed data).
+
+        Like dict.update, an object whose id is already stored replaces
+        the previous one without any duplicate check. Secondary indexes
+        are rebuilt once, in one pass over the storage, instead of being
+        maintained per object.
+
+        Args:
+            objs (Iterable): Object instances, each with an 'id' attribute.
+        """
+        self._storage.update({obj.id: obj for obj in objs})
+        for index in self._indexes.values():
+            index.clear()
+        for obj in self._storage.values():
+            self._index_add(obj)
+        self.version += 1
 
     def get(self, obj_id):
         """
@@ -119,14 +201,33 @@ class InMemoryRepository(Repository):
         """
         return self._storage.get(obj_id)
 
+    def exists(self, obj_id):
+        """
+        Check whether an object is stored, without fetching it.
+
+        Args:
+            obj_id (str): The object's unique identifier.
+
+        Returns:
+            bool: True if the object exists, otherwise False.
+        """
+        return obj_id in self._storage
+
     def get_all(self):
         """
         Retrieve all stored objects.
 
+        The result is a snapshot taken at the current version and
+        reused by every read until the next write.
+
         Returns:
-            list: A list of all stored objects.
+            tuple: All stored objects (read-only; do not mutate).
         """
-        return list(self._storage.values())
+        version, objects = self._snapshot
+        if version != self.version:
+            objects = tuple(self._storage.values())
+            self._snapshot = (self.version, objects)
+        return objects
 
     def update(self, obj_id, data):
         """
@@ -135,10 +236,20 @@ class InMemoryRepository(Repository):
         Args:
             obj_id (str): The object's unique identifier.
             data (dict): Dictionary of attributes to update.
+
+        Returns:
+            The updated object if found, otherwise None.
         """
-        obj = self.get(obj_id)
+        obj = self._storage.get(obj_id)
         if obj:
-            obj.update(data)
+            self._index_remove(obj)
+            try:
+                obj.update(data)
+            finally:
+                # Re-index even if a setter rejected part of the data
+                self._index_add(obj)
+                self.version += 1
+        return obj
 
     def delete(self, obj_id):
         """
@@ -147,13 +258,28 @@ class InMemoryRepository(Repository):
         Args:
             obj_id (str): The object's unique identifier.
         """
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        obj = self._storage.pop(obj_id, None)
+        if obj is not None:
+            self._index_remove(obj)
+            self.version += 1
+
+    def clear(self):
+        """Remove every stored object."""
+        self._storage.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self.version += 1
 
     def get_by_attribute(self, attr_name, attr_value):
         """
         Retrieve the first object that matches a given attribute value.
 
+        The first query on an attribute builds a hash index over it, so
+        later lookups are O(1). Attributes holding unhashable values
+        (e.g. relationship id collections) fall back to a linear scan.
+        On an empty repository nothing is indexed yet: the attribute is
+        left unindexed until a query sees at least one object.
+
         Args:
             attr_name (str): The attribute name to check.
             attr_value: The expected value of the attribute.
@@ -161,11 +287,34 @@ class InMemoryRepository(Repository):
         Returns:
             The first matching object if found, otherwise None.
         """
+        get_attr = attrgetter(attr_name)
+        index = self._indexes.get(attr_name)
+        if index is None:
+            if not self._storage:
+                return None
+            index = {}
+            try:
+                for obj in self._storage.values():
+                    index.setdefault(get_attr(obj), {})[obj.id] = None
+            except TypeError:
+                index = None
+            else:
+                self._indexes[attr_name] = index
+
+        if index is not None:
+            try:
+                bucket = index.get(attr_value)
+            except TypeError:
+                return None
+            if not bucket:
+                return None
+            return self._storage[next(iter(bucket))]
+
         return next(
             (
                 obj
                 for obj in self._storage.values()
-                if getattr(obj, attr_name) == attr_value
+                if get_attr(obj) == attr_value
             ),
             None
         )
@@ -8,13 +8,28 @@ and persistence mechanisms.
 """
 
 
+import re
+
 from app.persistence.repository import InMemoryRepository
-from app.models.user import User, re
+from app.models.user import User
 from app.models.place import Place
 from app.models.amenity import Amenity
 from app.models.review import Review
 
 
+# Simple email format check used on updates (enough for the project)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Accepted types for numeric place fields (bool is rejected separately)
+_NUMERIC = (int, float)
+
+# The only fields the update_* methods may modify; anything else in a
+# payload (ids, timestamps, relationships, unknown keys) is ignored
+USER_UPDATABLE = ('first_name', 'last_name', 'email')
+PLACE_UPDATABLE = ('title', 'description', 'price', 'latitude', 'longitude')
+REVIEW_UPDATABLE = ('text', 'rating')
+
+
 class HBnBFacade:
     """
     Central access point for all business logic operations.
@@ -31,12 +46,18 @@ class HBnBFacade:
         """
         Initialize in-memory repositories for each entity.
 
-        Each entity type is managed by its own repository instance.
+        Each entity type is managed by its own repository instance;
+        repositories lists them all for code that handles every one
+        of them (e.g. resetting state between tests).
         """
-        self.user_repo = InMemoryRepository()
+        self.user_repo = InMemoryRepository(indexes=('email',))
         self.place_repo = InMemoryRepository()
         self.review_repo = InMemoryRepository()
         self.amenity_repo = InMemoryRepository()
+        self.repositories = (
+            self.user_repo, self.place_repo,
+            self.review_repo, self.amenity_repo
+        )
 
     # ------------------------------------------------------------
     # -------------------------- USERS ---------------------------
@@ -67,12 +88,24 @@ class HBnBFacade:
         """
         return self.user_repo.get(user_id)
 
+    def user_exists(self, user_id):
+        """
+        Check whether a user exists.
+
+        Args:
+            user_id (str): The user's unique identifier.
+
+        Returns:
+            bool: True if the user exists, otherwise False.
+        """
+        return self.user_repo.exists(user_id)
+
     def get_users(self):
         """
         Retrieve all users.
 
         Returns:
-            list[User]: List of all stored users.
+            tuple[User]: All stored users.
         """
         return self.user_repo.get_all()
 
@@ -80,20 +113,23 @@ class HBnBFacade:
         """
         Retrieve a user by email address.
 
+        The lookup goes through the email index and is case-insensitive,
+        matching how emails are normalized when stored.
+
         Args:
             email (str): The email to search for.
 
         Returns:
             User | None: The matching user if found.
         """
-        return self.user_repo.get_by_attribute('email', email)
+        return self.user_repo.get_by_attribute('email', email.strip().lower())
 
     def update_user(self, user_id, user_data):
         """
         Update an existing user.
 
-        Protected fields (id, timestamps, admin status, relationships)
-        cannot be modified.
+        Only first_name, last_name and email can be modified; other
+        fields (id, timestamps, admin status, relationships) are ignored.
 
         Args:
             user_id (str): The user ID.
@@ -106,12 +142,10 @@ class HBnBFacade:
         if not user:
             return None
 
-        # prevent protected fields from being updated
-        forbidden = {
-            'id', 'created_at', 'updated_at',
-            'is_admin', 'place_ids', 'review_ids'
+        # keep only the fields that may be updated
+        clean_data = {
+            k: user_data[k] for k in USER_UPDATABLE if k in user_data
             }
-        clean_data = {k: v for k, v in user_data.items() if k not in forbidden}
 
         # ---- first_name ----
         if 'first_name' in clean_data:
@@ -142,13 +176,13 @@ class HBnBFacade:
             if email == "":
                 raise ValueError("email cannot be empty")
 
-            # Simple email format check (enough for the project)
-            if not re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email):
+            # Resubmitted forms often carry the unchanged email
+            if email != user.email and not _EMAIL_RE.match(email):
                 raise ValueError("Invalid email format")
 
             clean_data['email'] = email
-        self.user_repo.update(user_id, clean_data)
-        return self.user_repo.get(user_id)
+
+        return self.user_repo.update(user_id, clean_data)
 
     # ------------------------------------------------------------
     # -------------------------- PLACES --------------------------
@@ -166,7 +200,7 @@ class HBnBFacade:
         Returns:
             Place: The created place instance.
         """
-        if not self.user_repo.get(place_data["owner_id"]):
+        if not self.user_repo.exists(place_data["owner_id"]):
             raise ValueError("Owner not found")
         place = Place(**place_data)
         self.place_repo.add(place)
@@ -184,12 +218,34 @@ class HBnBFacade:
         """
         return self.place_repo.get(place_id)
 
+    def get_place_detail(self, place_id):
+        """
+        Retrieve a place together with its related entities.
+
+        Args:
+            place_id (str): The place's unique identifier.
+
+        Returns:
+            tuple | None: (place, owner, amenities, reviews) if the place
+            exists, otherwise None. owner may be None if it was removed.
+        """
+        place = self.place_repo.get(place_id)
+        if not place:
+            return None
+
+        return (
+            place,
+            self.user_repo.get(place.owner_id),
+            self.get_amenities_by_ids(place.amenity_ids),
+            self.get_reviews_by_place(place_id)
+        )
+
     def get_all_places(self):
         """
         Retrieve all places.
 
         Returns:
-            list[Place]: List of all stored places.
+            tuple[Place]: All stored places.
         """
         return self.place_repo.get_all()
 
@@ -197,7 +253,8 @@ class HBnBFacade:
         """
         Update an existing place.
 
-        Protected fields (id, timestamps, owner_id) cannot be modified.
+        Only title, description, price, location and amenities can be
+        modified; other fields (id, timestamps, owner_id) are ignored.
 
         Args:
             place_id (str): The place ID.
@@ -211,17 +268,12 @@ class HBnBFacade:
             return None
 
         # Handle amenity_ids separately via the model's helper
-        if 'amenities' in place_data and place_data['amenities'] is not None:
-            if not isinstance(place_data['amenities'], list):
-                raise TypeError("amenities must be a list of UUID strings")
-            place.amenity_ids = []
-            for aid in place_data['amenities']:
-                place.add_amenity_id(aid)
-
-        # prevent protected fields from being updated
-        forbidden = {'id', 'created_at', 'updated_at', 'owner_id'}
+        if place_data.get('amenities') is not None:
+            place.set_amenity_ids(place_data['amenities'])
+
+        # keep only the fields that may be updated
         clean_data = {
-            k: v for k, v in place_data.items() if k not in forbidden
+            k: place_data[k] for k in PLACE_UPDATABLE if k in place_data
             }
 
         # Re-validate updated fields (only if provided)
@@ -246,7 +298,7 @@ class HBnBFacade:
 
         if 'price' in clean_data:
             price = clean_data['price']
-            if not isinstance(price, (int, float)) or type(price) is bool:
+            if not isinstance(price, _NUMERIC) or type(price) is bool:
                 raise TypeError("Price must be a number")
             if price <= 0:
                 raise ValueError("Price must be positive")
@@ -254,7 +306,7 @@ class HBnBFacade:
 
         if 'latitude' in clean_data:
             latitude = clean_data['latitude']
-            if not isinstance(latitude, (int, float)) or type(latitude) is bool:
+            if not isinstance(latitude, _NUMERIC) or type(latitude) is bool:
                 raise TypeError("Latitude must be a number")
             if latitude < -90.0 or latitude > 90.0:
                 raise ValueError("Latitude must be between -90 and 90")
@@ -262,14 +314,13 @@ class HBnBFacade:
 
         if 'longitude' in clean_data:
             longitude = clean_data['longitude']
-            if not isinstance(longitude, (int, float)) or type(longitude) is bool:
+            if not isinstance(longitude, _NUMERIC) or type(longitude) is bool:
                 raise TypeError("Longitude must be a number")
             if longitude < -180.0 or longitude > 180.0:
                 raise ValueError("Longitude must be between -180 and 180")
             clean_data['longitude'] = float(longitude)
 
-        self.place_repo.update(place_id, clean_data)
-        return self.place_repo.get(place_id)
+        return self.place_repo.update(place_id, clean_data)
         
 
     # ------------------------------------------------------------
@@ -292,14 +343,18 @@ class HBnBFacade:
         Returns:
             Review: The created review instance.
         """
-        if not self.user_repo.get(review_data["user_id"]):
+        user = self.user_repo.get(review_data["user_id"])
+        if not user:
             raise ValueError("User not found")
 
-        if not self.place_repo.get(review_data["place_id"]):
+        place = self.place_repo.get(review_data["place_id"])
+        if not place:
             raise ValueError("Place not found")
 
         review = Review(**review_data)
         self.review_repo.add(review)
+        place.add_review(review)
+        user.add_review(review)
         return review
 
     def get_review(self, review_id):
@@ -319,7 +374,7 @@ class HBnBFacade:
         Retrieve all reviews.
 
         Returns:
-            list[Review]
+            tuple[Review]
         """
         return self.review_repo.get_all()
 
@@ -327,24 +382,32 @@ class HBnBFacade:
         """
         Retrieve all reviews associated with a given place.
 
+        Reviews are resolved through the place's review_ids instead of
+        scanning every stored review.
+
         Args:
             place_id (str): Place identifier.
 
         Returns:
             list[Review]
         """
+        place = self.place_repo.get(place_id)
+        if not place:
+            return []
+
+        get_review = self.review_repo.get
         return [
             review
-            for review in self.review_repo.get_all()
-            if review.place_id == place_id
+            for review in map(get_review, place.review_ids)
+            if review is not None
         ]
 
     def update_review(self, review_id, review_data):
         """
         Update an existing review.
 
-        Protected fields (id, timestamps, user_id, place_id)
-        cannot be modified.
+        Only text and rating can be modified; other fields (id,
+        timestamps, user_id, place_id) are ignored.
 
         Args:
             review_id (str): Review ID.
@@ -357,13 +420,9 @@ class HBnBFacade:
         if not review:
             return None
 
-        # prevent protected fields from being updated
-        forbidden = {
-            'id', 'created_at', 'updated_at',
-            'user_id', 'place_id'
-            }
+        # keep only the fields that may be updated
         clean_data = {
-            k: v for k, v in review_data.items() if k not in forbidden
+            k: review_data[k] for k in REVIEW_UPDATABLE if k in review_data
             }
 
         # ---- Validate text (if provided) ----
@@ -384,8 +443,8 @@ class HBnBFacade:
             if rating < 1 or rating > 5:
                 raise ValueError("Rating must be between 1 and 5")
             clean_data['rating'] = rating
-            self.review_repo.update(review_id, clean_data)
-            return self.review_repo.get(review_id)
+
+        return self.review_repo.update(review_id, clean_data)
 
     def delete_review(self, review_id):
         """
@@ -404,6 +463,13 @@ class HBnBFacade:
             return None
 
         self.review_repo.delete(review_id)
+
+        place = self.place_repo.get(review.place_id)
+        if place:
+            place.remove_review(review)
+        user = self.user_repo.get(review.user_id)
+        if user:
+            user.remove_review(review)
         return True
 
     # ------------------------------------------------------------
@@ -448,12 +514,31 @@ class HBnBFacade:
         """
         return self.amenity_repo.get(amenity_id)
 
+    def get_amenities_by_ids(self, amenity_ids):
+        """
+        Retrieve several amenities at once, preserving the given order.
+
+        Unknown identifiers are skipped.
+
+        Args:
+            amenity_ids (Iterable[str]): Amenity identifiers.
+
+        Returns:
+            list[Amenity]: The amenities found.
+        """
+        get_amenity = self.amenity_repo.get
+        return [
+            amenity
+            for amenity in map(get_amenity, amenity_ids)
+            if amenity is not None
+        ]
+
     def get_all_amenities(self):
         """
         Retrieve all amenities.
 
         Returns:
-            list[Amenity]: List of all stored amenities.
+            tuple[Amenity]: All stored amenities.
         """
         return self.amenity_repo.get_all()
 
@@ -461,7 +546,8 @@ class HBnBFacade:
         """
         Update an existing amenity.
 
-        Protected fields (id, timestamps) cannot be modified.
+        Only the name can be modified; other fields (id, timestamps)
+        are ignored.
 
         Args:
             amenity_id (str): The amenity ID.
@@ -479,26 +565,7 @@ class HBnBFacade:
 
         if "name" not in amenity_data:
             raise ValueError("name is required")
-        
-        name = amenity_data["name"]
 
-        #revalidate the "name" format
-        if not isinstance(name, str):
-            raise TypeError("Name must be a string")
+        clean_data = {"name": Amenity.validate_name(amenity_data["name"])}
 
-        name = name.strip()
-
-        if name == "":
-            raise ValueError("Name cannot be empty")
-
-        if len(name) > 50:
-            raise ValueError("Name must be 50 characters maximum")
-
-        # prevent protected fields from being updated
-        forbidden = {'id', 'created_at', 'updated_at'}
-        clean_data = {
-            k: v for k, v in amenity_data.items() if k not in forbidden
-            }
-
-        self.amenity_repo.update(amenity_id, clean_data)
-        return self.amenity_repo.get(amenity_id)
+        return self.amenity_repo.update(amenity_id, clean_data)
@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+"""
+Test package for the HBnB API.
+
+Provides get_app(), which builds the Flask application once and hands
+the same instance to every test class.
+"""
+
+from functools import lru_cache
+
+from app import create_app
+
+
+@lru_cache(maxsize=None)
+def get_app():
+    """
+    Return the application shared by all test modules.
+
+    Test state lives in the facade repositories, which each class
+    resets itself, so the app can safely be reused.
+    """
+    return create_app()
@@ -8,23 +8,30 @@ Tests cover:
 - Amenity update (success and failure cases)
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../hbnb')))
-
 import unittest
-from app import create_app
+from app.services import facade
+from tests import get_app
+from app.models.amenity import Amenity
 
 
 class TestAmenityEndpoints(unittest.TestCase):
     """Test suite for /api/v1/amenities/ endpoints."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Get the shared app and create a test client for the class."""
+        cls.app = get_app()
+        cls.client = cls.app.test_client(use_cookies=False)
+
     def setUp(self):
-        """Create a fresh app and test client before each test."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        from app.services import facade
-        facade.amenity_repo._storage.clear()
+        """Start each test with an empty amenity repository."""
+        facade.amenity_repo.clear()
+
+    def _seed(self, name):
+        """Store an amenity directly, bypassing the HTTP layer."""
+        amenity = Amenity(name)
+        facade.amenity_repo.add(amenity)
+        return amenity
 
     # ----------------------------------------------------------------
     # POST /api/v1/amenities/  —  creation
@@ -83,24 +90,38 @@ class TestAmenityEndpoints(unittest.TestCase):
 
     def test_get_amenities_after_creation(self):
         """After creating two amenities, the list contains exactly 2 items."""
-        self.client.post('/api/v1/amenities/', json={"name": "Wi-Fi"})
-        self.client.post('/api/v1/amenities/', json={"name": "Pool"})
+        self._seed("Wi-Fi")
+        self._seed("Pool")
         response = self.client.get('/api/v1/amenities/')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.get_json()), 2)
 
+    def test_get_amenities_not_modified(self):
+        """Replaying the list ETag → 304 until the list changes."""
+        self._seed("Wi-Fi")
+        etag = self.client.get('/api/v1/amenities/').headers['ETag']
+        response = self.client.get(
+            '/api/v1/amenities/', headers={'If-None-Match': etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        self._seed("Pool")
+        response = self.client.get(
+            '/api/v1/amenities/', headers={'If-None-Match': etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 2)
+
     # ----------------------------------------------------------------
     # GET /api/v1/amenities/<id>  —  retrieval by ID
     # ----------------------------------------------------------------
     def test_get_amenity_by_id_success(self):
         """Retrieve an existing amenity by ID → 200."""
-        created = self.client.post('/api/v1/amenities/', json={
-            "name": "Wi-Fi"
-        }).get_json()
-        response = self.client.get(f'/api/v1/amenities/{created["id"]}')
+        created = self._seed("Wi-Fi")
+        response = self.client.get(f'/api/v1/amenities/{created.id}')
         self.assertEqual(response.status_code, 200)
         data = response.get_json()
-        self.assertEqual(data["id"], created["id"])
+        self.assertEqual(data["id"], created.id)
         self.assertEqual(data["name"], "Wi-Fi")
 
     def test_get_amenity_not_found(self):
@@ -115,11 +136,9 @@ class TestAmenityEndpoints(unittest.TestCase):
     # ----------------------------------------------------------------
     def test_update_amenity_success(self):
         """Update amenity name → 200 with success message."""
-        created = self.client.post('/api/v1/amenities/', json={
-            "name": "Wi-Fi"
-        }).get_json()
+        created = self._seed("Wi-Fi")
         response = self.client.put(
-            f'/api/v1/amenities/{created["id"]}',
+            f'/api/v1/amenities/{created.id}',
             json={"name": "WiFi 6"}
         )
         self.assertEqual(response.status_code, 200)
@@ -130,26 +149,34 @@ class TestAmenityEndpoints(unittest.TestCase):
 
     def test_update_amenity_empty_name(self):
         """Update with empty name → 400."""
-        created = self.client.post('/api/v1/amenities/', json={
-            "name": "Wi-Fi"
-        }).get_json()
+        created = self._seed("Wi-Fi")
         response = self.client.put(
-            f'/api/v1/amenities/{created["id"]}',
+            f'/api/v1/amenities/{created.id}',
             json={"name": ""}
         )
         self.assertEqual(response.status_code, 400)
 
     def test_update_amenity_name_too_long(self):
         """Update with name longer than 50 characters → 400."""
-        created = self.client.post('/api/v1/amenities/', json={
-            "name": "Wi-Fi"
-        }).get_json()
+        created = self._seed("Wi-Fi")
         response = self.client.put(
-            f'/api/v1/amenities/{created["id"]}',
+            f'/api/v1/amenities/{created.id}',
             json={"name": "A" * 51}
         )
         self.assertEqual(response.status_code, 400)
 
+    def test_update_amenity_payload_not_object(self):
+        """Update with a non-object body → 400 naming the payload."""
+        created = self._seed("Wi-Fi")
+        response = self.client.put(
+            f'/api/v1/amenities/{created.id}',
+            json=["Pool"]
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()["error"], "payload must be object"
+        )
+
     def test_update_amenity_not_found(self):
         """Update a non-existent amenity → 404."""
         response = self.client.put(
@@ -160,16 +187,24 @@ class TestAmenityEndpoints(unittest.TestCase):
 
     def test_update_amenity_change_is_reflected(self):
         """After update, GET returns the new name."""
-        created = self.client.post('/api/v1/amenities/', json={
-            "name": "Wi-Fi"
-        }).get_json()
+        created = self._seed("Wi-Fi")
         self.client.put(
-            f'/api/v1/amenities/{created["id"]}',
+            f'/api/v1/amenities/{created.id}',
             json={"name": "Fiber Optic"}
         )
-        response = self.client.get(f'/api/v1/amenities/{created["id"]}')
+        response = self.client.get(f'/api/v1/amenities/{created.id}')
         self.assertEqual(response.get_json()["name"], "Fiber Optic")
 
+    def test_update_amenity_name_is_stripped(self):
+        """Surrounding whitespace is trimmed on update, as on creation."""
+        created = self._seed("Wi-Fi")
+        self.client.put(
+            f'/api/v1/amenities/{created.id}',
+            json={"name": "  Sauna  "}
+        )
+        response = self.client.get(f'/api/v1/amenities/{created.id}')
+        self.assertEqual(response.get_json()["name"], "Sauna")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
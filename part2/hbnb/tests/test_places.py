@@ -9,53 +9,60 @@ Tests cover:
 - Reviews list for a place
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../hbnb')))
-
 import unittest
-from app import create_app
+from app.services import facade
+from tests import get_app
 
 
 class TestPlaceEndpoints(unittest.TestCase):
     """Test suite for /api/v1/places/ endpoints."""
 
-    def setUp(self):
-        """Create a fresh app, test client, and a valid user before each test."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        from app.services import facade
-        facade.user_repo._storage.clear()
-        facade.place_repo._storage.clear()
-        facade.amenity_repo._storage.clear()
-        facade.review_repo._storage.clear()
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create the app and test client once for the whole class, along
+        with the owner and amenity shared by every test (read-only).
+        """
+        cls.app = get_app()
+        cls.client = cls.app.test_client(use_cookies=False)
+        for repo in facade.repositories:
+            repo.clear()
 
         # Create a user to use as owner in place tests
-        user = self.client.post('/api/v1/users/', json={
+        user = cls.client.post('/api/v1/users/', json={
             "first_name": "John",
             "last_name": "Doe",
             "email": "john.doe@example.com"
         }).get_json()
-        self.user_id = user["id"]
+        cls.user_id = user["id"]
 
         # Create an amenity to use in place tests
-        amenity = self.client.post('/api/v1/amenities/', json={
+        amenity = cls.client.post('/api/v1/amenities/', json={
             "name": "Wi-Fi"
         }).get_json()
-        self.amenity_id = amenity["id"]
+        cls.amenity_id = amenity["id"]
 
-    def _create_place(self, **kwargs):
-        """Helper to create a default valid place."""
-        data = {
+        # Payload used by _create_place; only read, never mutated
+        cls.default_place = {
             "title": "Cozy Apartment",
             "description": "A nice place",
             "price": 80.0,
             "latitude": 48.85,
             "longitude": 2.35,
-            "owner_id": self.user_id,
+            "owner_id": cls.user_id,
             "amenities": []
         }
-        data.update(kwargs)
+
+    def setUp(self):
+        """Start each test without places or reviews."""
+        facade.place_repo.clear()
+        facade.review_repo.clear()
+
+    def _create_place(self, **kwargs):
+        """Helper to create a default valid place."""
+        data = self.default_place
+        if kwargs:
+            data = {**data, **kwargs}
         return self.client.post('/api/v1/places/', json=data)
 
     # ----------------------------------------------------------------
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+Unit tests for the in-memory repository.
+
+Tests cover:
+- Bulk loading (storage, version and secondary indexes)
+- Lookups on attributes that are missing or unhashable
+"""
+
+import unittest
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.persistence.repository import InMemoryRepository
+
+
+class TestInMemoryRepository(unittest.TestCase):
+    """Test suite for InMemoryRepository."""
+
+    def setUp(self):
+        """Start each test with a repository indexed on name."""
+        self.repo = InMemoryRepository(indexes=('name',))
+
+    def test_bulk_add_stores_every_object(self):
+        """bulk_add stores all objects and bumps the version once."""
+        amenities = [Amenity("WiFi"), Amenity("Pool"), Amenity("Parking")]
+        version = self.repo.version
+        self.repo.bulk_add(amenities)
+        self.assertEqual(self.repo.version, version + 1)
+        self.assertCountEqual(self.repo.get_all(), amenities)
+        for amenity in amenities:
+            self.assertIs(self.repo.get(amenity.id), amenity)
+
+    def test_bulk_add_keeps_declared_indexes(self):
+        """Objects stored before and by bulk_add are all found by name."""
+        wifi = Amenity("WiFi")
+        self.repo.add(wifi)
+        pool = Amenity("Pool")
+        self.repo.bulk_add([pool])
+        self.assertIs(self.repo.get_by_attribute("name", "WiFi"), wifi)
+        self.assertIs(self.repo.get_by_attribute("name", "Pool"), pool)
+
+    def test_bulk_add_replaces_objects_in_indexes(self):
+        """A replaced object is no longer found under its old value."""
+        wifi = Amenity("WiFi")
+        self.repo.add(wifi)
+        replacement = Amenity("Fast WiFi")
+        replacement.id = wifi.id
+        self.repo.bulk_add([replacement])
+        self.assertIsNone(self.repo.get_by_attribute("name", "WiFi"))
+        self.assertIs(
+            self.repo.get_by_attribute("name", "Fast WiFi"), replacement
+        )
+        self.assertEqual(len(self.repo.get_all()), 1)
+
+    def test_lookup_on_empty_repository_does_not_break_add(self):
+        """Querying an empty repository leaves later writes working."""
+        cases = (
+            (InMemoryRepository(), "nmae", Amenity("WiFi")),
+            (InMemoryRepository(), "review_ids", User(
+                first_name="John", last_name="Doe",
+                email="john.doe@example.com"
+            )),
+        )
+        for repo, attr_name, obj in cases:
+            with self.subTest(attr_name=attr_name):
+                self.assertIsNone(repo.get_by_attribute(attr_name, "x"))
+                version = repo.version
+                repo.add(obj)
+                self.assertIs(repo.get(obj.id), obj)
+                self.assertEqual(repo.version, version + 1)
+
+    def test_declared_index_skips_unhashable_values(self):
+        """An unhashable value is left out of a declared index."""
+        repo = InMemoryRepository(indexes=("review_ids",))
+        user = User(
+            first_name="John", last_name="Doe", email="john.doe@example.com"
+        )
+        repo.add(user)
+        self.assertIs(repo.get(user.id), user)
+        repo.update(user.id, {"first_name": "Jane"})
+        repo.delete(user.id)
+        self.assertIsNone(repo.get(user.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
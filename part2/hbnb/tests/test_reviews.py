@@ -9,65 +9,96 @@ Tests cover:
 - Review deletion
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../hbnb')))
-
 import unittest
-from app import create_app
+from app.services import facade
+from tests import get_app
 
 
 class TestReviewEndpoints(unittest.TestCase):
     """Test suite for /api/v1/reviews/ endpoints."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the app, test client, users and place once per class."""
+        cls.app = get_app()
+        cls.client = cls.app.test_client(use_cookies=False)
+        cls._seed()
+
     def setUp(self):
-        """Create a fresh app, test client, and valid user + place before each test."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        from app.services import facade
-        facade.user_repo._storage.clear()
-        facade.place_repo._storage.clear()
-        facade.amenity_repo._storage.clear()
-        facade.review_repo._storage.clear()
+        """
+        Start each test without reviews.
+
+        Reviews are deleted through the facade so the shared place and
+        reviewer drop their review ids too. The users and place are
+        rebuilt only if a test added or changed some.
+        """
+        for review in facade.get_all_reviews():
+            facade.delete_review(review.id)
+        if self._seed_versions() != self._seeded_versions:
+            self._seed()
+
+    @classmethod
+    def _seed_versions(cls):
+        """Return the versions of the repositories seeded per class."""
+        return (facade.user_repo.version, facade.place_repo.version)
+
+    @classmethod
+    def _seed(cls):
+        """Reset all repositories and create the owner, reviewer and place."""
+        for repo in facade.repositories:
+            repo.clear()
 
         # Create owner
-        owner = self.client.post('/api/v1/users/', json={
+        cls.owner_id = facade.create_user({
             "first_name": "John",
             "last_name": "Doe",
             "email": "john.doe@example.com"
-        }).get_json()
-        self.owner_id = owner["id"]
+        }).id
 
         # Create reviewer (different from owner)
-        reviewer = self.client.post('/api/v1/users/', json={
+        cls.reviewer_id = facade.create_user({
             "first_name": "Jane",
             "last_name": "Smith",
             "email": "jane.smith@example.com"
-        }).get_json()
-        self.reviewer_id = reviewer["id"]
+        }).id
 
         # Create a place
-        place = self.client.post('/api/v1/places/', json={
+        cls.place_id = facade.create_place({
             "title": "Cozy Apartment",
             "description": "A nice place",
             "price": 80.0,
             "latitude": 48.85,
             "longitude": 2.35,
-            "owner_id": self.owner_id,
+            "owner_id": cls.owner_id,
             "amenities": []
-        }).get_json()
-        self.place_id = place["id"]
+        }).id
 
-    def _create_review(self, **kwargs):
-        """Helper to create a default valid review."""
-        data = {
+        # Payload used by _review_data; only read, never mutated
+        cls.default_review = {
             "text": "Great place!",
             "rating": 5,
-            "user_id": self.reviewer_id,
-            "place_id": self.place_id
+            "user_id": cls.reviewer_id,
+            "place_id": cls.place_id
         }
-        data.update(kwargs)
-        return self.client.post('/api/v1/reviews/', json=data)
+
+        cls._seeded_versions = cls._seed_versions()
+
+    def _review_data(self, **kwargs):
+        """Return the default valid review payload, with overrides."""
+        data = self.default_review
+        if kwargs:
+            data = {**data, **kwargs}
+        return data
+
+    def _create_review(self, **kwargs):
+        """Helper to create a default valid review through the API."""
+        return self.client.post(
+            '/api/v1/reviews/', json=self._review_data(**kwargs)
+        )
+
+    def _create_review_id(self, **kwargs):
+        """Store a default valid review directly; return its ID."""
+        return facade.create_review(self._review_data(**kwargs)).id
 
     # ----------------------------------------------------------------
     # POST /api/v1/reviews/  —  creation
@@ -88,29 +119,21 @@ class TestReviewEndpoints(unittest.TestCase):
         response = self._create_review(rating=1)
         self.assertEqual(response.status_code, 201)
 
-    def test_create_review_missing_text(self):
-        """Missing text field → 400."""
-        response = self.client.post('/api/v1/reviews/', json={
-            "rating": 5,
-            "user_id": self.reviewer_id,
-            "place_id": self.place_id
-        })
-        self.assertEqual(response.status_code, 400)
+    def test_create_review_missing_field(self):
+        """Any missing required field → 400."""
+        for field in self.default_review:
+            with self.subTest(field=field):
+                data = {
+                    k: v for k, v in self.default_review.items() if k != field
+                }
+                response = self.client.post('/api/v1/reviews/', json=data)
+                self.assertEqual(response.status_code, 400)
 
     def test_create_review_empty_text(self):
         """Empty text → 400."""
         response = self._create_review(text="")
         self.assertEqual(response.status_code, 400)
 
-    def test_create_review_missing_rating(self):
-        """Missing rating field → 400."""
-        response = self.client.post('/api/v1/reviews/', json={
-            "text": "Great place!",
-            "user_id": self.reviewer_id,
-            "place_id": self.place_id
-        })
-        self.assertEqual(response.status_code, 400)
-
     def test_create_review_rating_too_high(self):
         """Rating above 5 → 400."""
         response = self._create_review(rating=6)
@@ -121,6 +144,14 @@ class TestReviewEndpoints(unittest.TestCase):
         response = self._create_review(rating=0)
         self.assertEqual(response.status_code, 400)
 
+    def test_create_review_rating_wrong_type(self):
+        """Non-integer rating → 400 naming the field, not the schema var."""
+        response = self._create_review(rating="five")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()["error"], "rating must be integer"
+        )
+
     def test_create_review_invalid_user_id(self):
         """Non-existent user_id → 400."""
         response = self._create_review(
@@ -135,24 +166,6 @@ class TestReviewEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    def test_create_review_missing_user_id(self):
-        """Missing user_id field → 400."""
-        response = self.client.post('/api/v1/reviews/', json={
-            "text": "Great place!",
-            "rating": 5,
-            "place_id": self.place_id
-        })
-        self.assertEqual(response.status_code, 400)
-
-    def test_create_review_missing_place_id(self):
-        """Missing place_id field → 400."""
-        response = self.client.post('/api/v1/reviews/', json={
-            "text": "Great place!",
-            "rating": 5,
-            "user_id": self.reviewer_id
-        })
-        self.assertEqual(response.status_code, 400)
-
     # ----------------------------------------------------------------
     # GET /api/v1/reviews/  —  list
     # ----------------------------------------------------------------
@@ -183,11 +196,11 @@ class TestReviewEndpoints(unittest.TestCase):
     # ----------------------------------------------------------------
     def test_get_review_by_id_success(self):
         """Retrieve an existing review by ID → 200."""
-        created = self._create_review().get_json()
-        response = self.client.get(f'/api/v1/reviews/{created["id"]}')
+        review_id = self._create_review_id()
+        response = self.client.get(f'/api/v1/reviews/{review_id}')
         self.assertEqual(response.status_code, 200)
         data = response.get_json()
-        self.assertEqual(data["id"], created["id"])
+        self.assertEqual(data["id"], review_id)
         self.assertEqual(data["text"], "Great place!")
         self.assertEqual(data["rating"], 5)
 
@@ -203,8 +216,8 @@ class TestReviewEndpoints(unittest.TestCase):
     # ----------------------------------------------------------------
     def test_update_review_success(self):
         """Update review text and rating → 200 with success message."""
-        created = self._create_review().get_json()
-        response = self.client.put(f'/api/v1/reviews/{created["id"]}', json={
+        review_id = self._create_review_id()
+        response = self.client.put(f'/api/v1/reviews/{review_id}', json={
             "text": "Updated review",
             "rating": 4,
             "user_id": self.reviewer_id,
@@ -218,22 +231,33 @@ class TestReviewEndpoints(unittest.TestCase):
 
     def test_update_review_change_is_reflected(self):
         """After update, GET returns the new values."""
-        created = self._create_review().get_json()
-        self.client.put(f'/api/v1/reviews/{created["id"]}', json={
+        review_id = self._create_review_id()
+        self.client.put(f'/api/v1/reviews/{review_id}', json={
             "text": "Actually just okay",
             "rating": 3,
             "user_id": self.reviewer_id,
             "place_id": self.place_id
         })
-        response = self.client.get(f'/api/v1/reviews/{created["id"]}')
+        response = self.client.get(f'/api/v1/reviews/{review_id}')
         data = response.get_json()
         self.assertEqual(data["text"], "Actually just okay")
         self.assertEqual(data["rating"], 3)
 
+    def test_update_review_text_only(self):
+        """A text-only update (no rating) is persisted and returned."""
+        review_id = self._create_review_id()
+        updated = facade.update_review(review_id, {"text": "Text only"})
+        self.assertIsNotNone(updated)
+        self.assertEqual(updated.id, review_id)
+        response = self.client.get(f'/api/v1/reviews/{review_id}')
+        data = response.get_json()
+        self.assertEqual(data["text"], "Text only")
+        self.assertEqual(data["rating"], 5)
+
     def test_update_review_rating_too_high(self):
         """Update with rating above 5 → 400."""
-        created = self._create_review().get_json()
-        response = self.client.put(f'/api/v1/reviews/{created["id"]}', json={
+        review_id = self._create_review_id()
+        response = self.client.put(f'/api/v1/reviews/{review_id}', json={
             "text": "Great!",
             "rating": 6,
             "user_id": self.reviewer_id,
@@ -243,8 +267,8 @@ class TestReviewEndpoints(unittest.TestCase):
 
     def test_update_review_empty_text(self):
         """Update with empty text → 400."""
-        created = self._create_review().get_json()
-        response = self.client.put(f'/api/v1/reviews/{created["id"]}', json={
+        review_id = self._create_review_id()
+        response = self.client.put(f'/api/v1/reviews/{review_id}', json={
             "text": "",
             "rating": 4,
             "user_id": self.reviewer_id,
@@ -270,8 +294,8 @@ class TestReviewEndpoints(unittest.TestCase):
     # ----------------------------------------------------------------
     def test_delete_review_success(self):
         """Delete an existing review → 200 with success message."""
-        created = self._create_review().get_json()
-        response = self.client.delete(f'/api/v1/reviews/{created["id"]}')
+        review_id = self._create_review_id()
+        response = self.client.delete(f'/api/v1/reviews/{review_id}')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response.get_json()["message"],
@@ -279,11 +303,10 @@ class TestReviewEndpoints(unittest.TestCase):
         )
 
     def test_delete_review_no_longer_exists(self):
-        """After deletion, GET on the review → 404."""
-        created = self._create_review().get_json()
-        self.client.delete(f'/api/v1/reviews/{created["id"]}')
-        response = self.client.get(f'/api/v1/reviews/{created["id"]}')
-        self.assertEqual(response.status_code, 404)
+        """After deletion, the review is gone from storage."""
+        review_id = self._create_review_id()
+        self.client.delete(f'/api/v1/reviews/{review_id}')
+        self.assertIsNone(facade.get_review(review_id))
 
     def test_delete_review_not_found(self):
         """Delete a non-existent review → 404."""
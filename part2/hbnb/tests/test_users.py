@@ -8,34 +8,45 @@ Tests cover:
 - User update (success and forbidden fields)
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../hbnb')))
-
 import unittest
-from app import create_app
+from app.api.v1.streaming import STREAM_BATCH_SIZE
+from app.services import facade
+from tests import get_app
 
 
 class TestUserEndpoints(unittest.TestCase):
     """Test suite for /api/v1/users/ endpoints."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Get the shared app and create a test client for the class."""
+        cls.app = get_app()
+        cls.client = cls.app.test_client(use_cookies=False)
+
+        # Payload used by _create_user; only read, never mutated
+        cls.default_user = {
+            "first_name": "John",
+            "last_name": "Doe",
+            "email": "john.doe@example.com"
+        }
+
     def setUp(self):
-        """Create a fresh app and test client before each test."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-        from app.services import facade
-        facade.user_repo._storage.clear()
+        """Start each test with an empty user repository."""
+        facade.user_repo.clear()
+
+    def _create_user(self, **kwargs):
+        """Helper to create a default valid user through the API."""
+        data = self.default_user
+        if kwargs:
+            data = {**data, **kwargs}
+        return self.client.post('/api/v1/users/', json=data)
 
     # ----------------------------------------------------------------
     # POST /api/v1/users/  —  creation
     # ----------------------------------------------------------------
     def test_create_user_success(self):
         """Create a valid user → 201 with correct data."""
-        response = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        })
+        response = self._create_user()
         self.assertEqual(response.status_code, 201)
         data = response.get_json()
         self.assertIn("id", data)
@@ -43,29 +54,15 @@ class TestUserEndpoints(unittest.TestCase):
         self.assertEqual(data["last_name"], "Doe")
         self.assertEqual(data["email"], "john.doe@example.com")
 
-    def test_create_user_missing_first_name(self):
-        """Missing first_name field → 400."""
-        response = self.client.post('/api/v1/users/', json={
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        })
-        self.assertEqual(response.status_code, 400)
-
-    def test_create_user_missing_last_name(self):
-        """Missing last_name field → 400."""
-        response = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "email": "john.doe@example.com"
-        })
-        self.assertEqual(response.status_code, 400)
-
-    def test_create_user_missing_email(self):
-        """Missing email field → 400."""
-        response = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe"
-        })
-        self.assertEqual(response.status_code, 400)
+    def test_create_user_missing_field(self):
+        """Any missing required field → 400."""
+        for field in self.default_user:
+            with self.subTest(field=field):
+                data = {
+                    k: v for k, v in self.default_user.items() if k != field
+                }
+                response = self.client.post('/api/v1/users/', json=data)
+                self.assertEqual(response.status_code, 400)
 
     def test_create_user_empty_first_name(self):
         """Empty first_name → 400."""
@@ -145,6 +142,20 @@ class TestUserEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 409)
         self.assertIn("error", response.get_json())
 
+    def test_create_user_duplicate_email_different_case(self):
+        """Same email with different casing → 409 on the second request."""
+        self.client.post('/api/v1/users/', json={
+            "first_name": "John",
+            "last_name": "Doe",
+            "email": "duplicate@example.com"
+        })
+        response = self.client.post('/api/v1/users/', json={
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": "Duplicate@Example.com"
+        })
+        self.assertEqual(response.status_code, 409)
+
     # ----------------------------------------------------------------
     # GET /api/v1/users/  —  list
     # ----------------------------------------------------------------
@@ -156,25 +167,32 @@ class TestUserEndpoints(unittest.TestCase):
 
     def test_get_users_after_creation(self):
         """After creating one user, the list contains exactly 1 item."""
-        self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        })
+        self._create_user()
         response = self.client.get('/api/v1/users/')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.get_json()), 1)
 
+    def test_get_users_spanning_several_batches(self):
+        """A list longer than one stream batch is still one JSON array."""
+        count = STREAM_BATCH_SIZE + 1
+        for i in range(count):
+            facade.create_user({
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": f"john.doe{i}@example.com"
+            })
+        response = self.client.get('/api/v1/users/')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(len(data), count)
+        self.assertEqual(len({user["id"] for user in data}), count)
+
     # ----------------------------------------------------------------
     # GET /api/v1/users/<id>  —  retrieval by ID
     # ----------------------------------------------------------------
     def test_get_user_by_id_success(self):
         """Retrieve an existing user by ID → 200."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         response = self.client.get(f'/api/v1/users/{created["id"]}')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.get_json()["id"], created["id"])
@@ -191,11 +209,7 @@ class TestUserEndpoints(unittest.TestCase):
     # ----------------------------------------------------------------
     def test_update_user_success(self):
         """Update first_name and last_name → 200 with new values."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         response = self.client.put(f'/api/v1/users/{created["id"]}', json={
             "first_name": "Jane",
             "last_name": "Smith"
@@ -207,11 +221,7 @@ class TestUserEndpoints(unittest.TestCase):
 
     def test_update_user_email_success(self):
         """Update email → 200 with new email."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         response = self.client.put(f'/api/v1/users/{created["id"]}', json={
             "email": "new.email@example.com"
         })
@@ -220,11 +230,7 @@ class TestUserEndpoints(unittest.TestCase):
 
     def test_update_user_invalid_email(self):
         """Update with invalid email → 400."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         response = self.client.put(f'/api/v1/users/{created["id"]}', json={
             "email": "not-valid"
         })
@@ -232,11 +238,7 @@ class TestUserEndpoints(unittest.TestCase):
 
     def test_update_user_duplicate_email(self):
         """Update email to an already used email → 409."""
-        self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        })
+        self._create_user()
         user2 = self.client.post('/api/v1/users/', json={
             "first_name": "Jane",
             "last_name": "Doe",
@@ -247,6 +249,19 @@ class TestUserEndpoints(unittest.TestCase):
         })
         self.assertEqual(response.status_code, 409)
 
+    def test_update_user_email_frees_old_email(self):
+        """After an email change, the old email can be registered again."""
+        user = self._create_user().get_json()
+        self.client.put(f'/api/v1/users/{user["id"]}', json={
+            "email": "john.new@example.com"
+        })
+        response = self.client.post('/api/v1/users/', json={
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": "john.doe@example.com"
+        })
+        self.assertEqual(response.status_code, 201)
+
     def test_update_user_not_found(self):
         """Update a non-existent user → 404."""
         response = self.client.put(
@@ -257,35 +272,25 @@ class TestUserEndpoints(unittest.TestCase):
 
     def test_update_user_id_is_forbidden(self):
         """Attempting to modify the id field → id remains unchanged."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         original_id = created["id"]
         self.client.put(f'/api/v1/users/{original_id}', json={
             "id": "00000000-0000-0000-0000-000000000000",
             "first_name": "Jane"
         })
-        response = self.client.get(f'/api/v1/users/{original_id}')
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.get_json()["id"], original_id)
+        user = facade.get_user(original_id)
+        self.assertIsNotNone(user)
+        self.assertEqual(user.id, original_id)
 
     def test_update_user_is_admin_is_forbidden(self):
         """Attempting to set is_admin to True → is_admin remains False."""
-        created = self.client.post('/api/v1/users/', json={
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com"
-        }).get_json()
+        created = self._create_user().get_json()
         self.client.put(f'/api/v1/users/{created["id"]}', json={
             "is_admin": True,
             "first_name": "John"
         })
-        with self.app.app_context():
-            from app.services import facade
-            user = facade.get_user(created["id"])
-            self.assertFalse(user.is_admin)
+        user = facade.get_user(created["id"])
+        self.assertFalse(user.is_admin)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,16 @@
+#!/usr/bin/python3
+"""
+WSGI entry point.
+
+Exposes the application object for production WSGI servers, e.g.:
+
+    gunicorn -w 1 -k gevent --worker-connections 1000 wsgi:application
+
+A single worker is used because repositories are kept in memory and
+would not be shared between worker processes.
+"""
+
+
+from app import create_app
+
+application = create_app()